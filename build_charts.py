@@ -0,0 +1,40 @@
+"""
+Precompute the dashboard's Plotly figures into charts.json.
+
+Every value behind the charts is a hard-coded constant, so the figures are
+rendered once here and the app only loads the resulting JSON.
+
+Usage:
+    python build_charts.py
+"""
+
+import json
+from pathlib import Path
+
+from charts import (
+    build_growth_fig,
+    build_keywords_fig,
+    build_soph_fig,
+    build_violations_fig,
+    build_yearly_fig,
+)
+from data import growth_data, keyword_data, sophistication_data, violation_data, yearly_data
+
+CHARTS_PATH = Path(__file__).with_name("charts.json")
+
+
+def main() -> None:
+    figures = {
+        'yearly': build_yearly_fig(yearly_data),
+        'violations': build_violations_fig(violation_data),
+        'sophistication': build_soph_fig(sophistication_data),
+        'keywords': build_keywords_fig(keyword_data),
+        'growth': build_growth_fig(growth_data),
+    }
+    specs = {name: json.loads(fig.to_json()) for name, fig in figures.items()}
+    CHARTS_PATH.write_text(json.dumps(specs, indent=2) + "\n")
+    print(f"Wrote {len(specs)} figures to {CHARTS_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Plotly figure builders for the FDA CSV violations dashboard.
+
+These run at build time only: build_charts.py renders every figure into
+charts.json, which the app loads instead of rebuilding the figures.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# ============================================================================
+# CHARTS
+# ============================================================================
+
+# Full-width narrative charts are pinned to a fixed width that fits the wide
+# layout next to the expanded sidebar, so the browser never re-lays them out.
+CHART_WIDTH = 900
+
+# Shared font and axis styles. Plotly copies these into each figure, so one
+# module-level dict can back every chart.
+FONT_FAMILY = 'Source Sans Pro'
+TICK_FONT = dict(size=11, family=FONT_FAMILY)
+TITLE_FONT = dict(size=12, family=FONT_FAMILY)
+LABEL_FONT = dict(size=13, family=FONT_FAMILY)
+GRID_AXIS = dict(showgrid=True, gridcolor='#f1f5f9', tickfont=TICK_FONT)
+
+# Streamlit restyles every chart in the browser, so the Python-side template
+# is dropped from the figure JSON rather than shipped with each chart. The
+# layout font is the default for any text without its own font settings.
+BASE_LAYOUT = dict(
+    template=None,
+    font=dict(family=FONT_FAMILY, size=12),
+    plot_bgcolor='white',
+    paper_bgcolor='white'
+)
+
+
+# Yearly trend
+def build_yearly_fig(df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    # Add area fill
+    fig.add_trace(go.Scatter(
+        x=df['Year'],
+        y=df['Observations'],
+        fill='tozeroy',
+        fillcolor='rgba(220, 38, 38, 0.1)',
+        line=dict(color='rgba(220, 38, 38, 0)'),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+
+    # Add line with markers
+    fig.add_trace(go.Scatter(
+        x=df['Year'],
+        y=df['Observations'],
+        mode='lines+markers+text',
+        text=df['Observations'],
+        textposition='top center',
+        textfont=dict(size=16, color='#dc2626', family=FONT_FAMILY),
+        line=dict(color='#dc2626', width=4),
+        marker=dict(size=14, color='#dc2626', line=dict(color='white', width=2)),
+        showlegend=False
+    ))
+
+    # Annotation for spike
+    fig.add_annotation(
+        x='2024', y=23,
+        text="<b>+187%</b><br>vs prior year",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=1.5,
+        arrowcolor='#dc2626',
+        ax=80,
+        ay=-50,
+        font=dict(size=14, color='#dc2626', family=FONT_FAMILY),
+        bgcolor='white',
+        bordercolor='#dc2626',
+        borderwidth=2,
+        borderpad=6
+    )
+
+    fig.update_layout(
+        **BASE_LAYOUT,
+        width=CHART_WIDTH,
+        height=400,
+        xaxis=dict(
+            showgrid=False, 
+            tickfont=dict(size=14, family=FONT_FAMILY),
+            title=None
+        ),
+        yaxis=GRID_AXIS | dict(
+            title=dict(text='Observations', font=TITLE_FONT),
+            tickfont=TITLE_FONT
+        ),
+        margin=dict(l=60, r=40, t=20, b=40)
+    )
+
+    return fig
+
+
+# Horizontal bar chart of violation types
+def build_violations_fig(df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    colors = np.where(np.arange(len(df)) == 0, '#dc2626', '#475569')
+
+    fig.add_trace(go.Bar(
+        y=df['Violation Type'],
+        x=df['Count'],
+        orientation='h',
+        marker=dict(color=colors, line=dict(width=0)),
+        text=("<b>" + df['Count'].astype(str) + "</b> (" + df['Percentage'].astype(str) + "%)").to_numpy(),
+        textposition='outside',
+        textfont=TITLE_FONT,
+        hovertemplate='%{y}: %{x} observations<extra></extra>'
+    ))
+
+    fig.update_layout(
+        **BASE_LAYOUT,
+        height=450,
+        xaxis=GRID_AXIS | dict(
+            title=dict(text='Number of Observations', font=TITLE_FONT),
+            range=[0, 65]
+        ),
+        yaxis=dict(
+            showgrid=False, 
+            autorange='reversed',
+            tickfont=TICK_FONT
+        ),
+        margin=dict(l=200, r=80, t=20, b=40)
+    )
+
+    return fig
+
+
+# Grouped bar chart of basic vs complex failures by region
+def build_soph_fig(df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Basic Failures',
+        x=df['Region'],
+        y=df['Basic Failures'],
+        marker_color='#f87171',
+        text=(df['Basic Failures'].astype(str) + "%").to_numpy(),
+        textposition='outside',
+        textfont=LABEL_FONT
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Complex Failures',
+        x=df['Region'],
+        y=df['Complex Failures'],
+        marker_color='#1e40af',
+        text=(df['Complex Failures'].astype(str) + "%").to_numpy(),
+        textposition='outside',
+        textfont=LABEL_FONT
+    ))
+
+    fig.update_layout(
+        **BASE_LAYOUT,
+        barmode='group',
+        height=380,
+        legend=dict(
+            orientation='h', 
+            yanchor='bottom', 
+            y=1.02,
+            font=TITLE_FONT
+        ),
+        xaxis=dict(
+            showgrid=False,
+            tickfont=LABEL_FONT
+        ),
+        yaxis=GRID_AXIS | dict(
+            title=dict(text='% of Regional Citations', font=TITLE_FONT)
+        ),
+        margin=dict(l=60, r=40, t=40, b=40)
+    )
+
+    return fig
+
+
+# Concerning keywords
+def build_keywords_fig(df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    colors = np.where(
+        df['Finding'].isin(['Delete capability', 'Spreadsheet use', 'Administrator access']),
+        '#dc2626', '#64748b'
+    )
+
+    fig.add_trace(go.Bar(
+        x=df['Finding'],
+        y=df['Pct_of_Observations'],
+        marker_color=colors,
+        text=("<b>" + df['Pct_of_Observations'].astype(str) + "%</b>").to_numpy(),
+        textposition='outside',
+        textfont=TITLE_FONT,
+        hovertemplate='%{x}: %{y}% of observations<extra></extra>'
+    ))
+
+    fig.update_layout(
+        **BASE_LAYOUT,
+        width=CHART_WIDTH,
+        height=350,
+        xaxis=dict(
+            showgrid=False, 
+            tickangle=30,
+            tickfont=TICK_FONT
+        ),
+        yaxis=GRID_AXIS | dict(
+            title=dict(text='% of Observations', font=TITLE_FONT)
+        ),
+        margin=dict(l=60, r=40, t=20, b=100)
+    )
+
+    return fig
+
+
+# Year-over-year change
+def build_growth_fig(df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    colors = np.where(df['Growth_Pct'] > 0, '#dc2626', '#059669')
+
+    fig.add_trace(go.Bar(
+        x=df['Violation Type'],
+        y=df['Growth_Pct'],
+        marker_color=colors,
+        text=df['Growth_Pct'].map("<b>{:+d}%</b>".format).to_numpy(),
+        textposition='outside',
+        textfont=dict(size=14, family=FONT_FAMILY, color=colors)
+    ))
+
+    fig.add_hline(y=0, line_dash="dash", line_color="#94a3b8", line_width=2)
+
+    fig.update_layout(
+        **BASE_LAYOUT,
+        width=CHART_WIDTH,
+        height=380,
+        xaxis=dict(
+            showgrid=False,
+            tickfont=LABEL_FONT
+        ),
+        yaxis=GRID_AXIS | dict(
+            title=dict(text='% Change (2022 → 2024)', font=TITLE_FONT),
+            range=[-70, 50]
+        ),
+        margin=dict(l=60, r=40, t=20, b=60)
+    )
+
+    return fig
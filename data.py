@@ -0,0 +1,147 @@
+"""
+Hard-coded tables behind the FDA CSV violations dashboard.
+Shared by the app and by build_charts.py.
+
+All tables live in one long-format frame (kind, label, metric, value) so the
+labels of every table share a single categorical dictionary. The per-chart
+tables below are wide views sliced back out of it.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+TOTAL_OBSERVATIONS = 141
+TOTAL_LETTERS = 111
+TOTAL_COMPANIES = 109
+
+# First year of the 2024-2025 citation surge
+SURGE_YEAR = 2024
+
+
+def _long(kind: str, label: str, table: dict) -> pd.DataFrame:
+    return (
+        pd.DataFrame(table)
+        .melt(id_vars=label, var_name='metric', value_name='value')
+        .rename(columns={label: 'label'})
+        .assign(kind=kind)
+    )
+
+
+@st.cache_data
+def _dashboard_data() -> pd.DataFrame:
+    return pd.concat([
+        # Yearly trend
+        _long('yearly', 'Year', {
+            'Year': ['2020', '2021', '2022', '2023', '2024', '2025'],
+            'Observations': [8, 7, 17, 8, 23, 22]
+        }),
+
+        # Violation types (no proprietary names)
+        _long('violation', 'Violation Type', {
+            'Violation Type': [
+                'Audit Trail Failures',
+                'Automatic Equipment Controls (211.68)',
+                'Chromatography Data Systems',
+                'Electronic Records',
+                'Password & Login Issues',
+                'Computerized Systems General',
+                'Access Control Failures',
+                'Software Validation',
+                'Data Backup Deficiencies'
+            ],
+            'Count': [49, 40, 24, 24, 24, 22, 21, 19, 8],
+            'Percentage': [34.8, 28.4, 17.0, 17.0, 17.0, 15.6, 14.9, 13.5, 5.7]
+        }),
+
+        # Geographic distribution (no company names)
+        _long('geo', 'Region', {
+            'Region': ['United States', 'India', 'China', 'Germany', 'South Korea', 'Other Regions'],
+            'Observations': [71, 28, 14, 6, 3, 19],
+            'Percentage': [50.4, 19.9, 9.9, 4.3, 2.1, 13.4]
+        }),
+
+        # Sophistication analysis
+        _long('sophistication', 'Region', {
+            'Region': ['United States', 'India', 'China'],
+            'Basic Failures': [36.4, 21.1, 33.3],
+            'Complex Failures': [34.3, 22.8, 22.2],
+            'Sophistication Ratio': [0.94, 1.08, 0.67]
+        }),
+
+        # Facility type
+        _long('facility', 'Facility Type', {
+            'Facility Type': ['QC Laboratory', 'API Manufacturing', 'Sterile Manufacturing', 'Finished Dosage', 'Other'],
+            'Audit Trail Violations': [17, 11, 3, 6, 12],
+            'Other CSV Violations': [12, 15, 11, 9, 45]
+        }),
+
+        # Year-over-year change
+        _long('growth', 'Violation Type', {
+            'Violation Type': ['Audit Trail', 'Password Security', 'Electronic Records', 'Equipment Controls'],
+            'Y2022': [9, 7, 4, 7],
+            'Y2024': [12, 3, 4, 7],
+            'Growth_Pct': [33, -57, 0, 0]
+        }),
+
+        # Co-occurrence patterns
+        _long('cooccurrence', 'Violation Pair', {
+            'Violation Pair': [
+                'Audit Trail + Password Issues',
+                'Audit Trail + Equipment Controls',
+                'Audit Trail + Chromatography Systems',
+                'Audit Trail + Access Control',
+                'Audit Trail + Electronic Records'
+            ],
+            'Co_occurrences': [20, 20, 16, 16, 14]
+        }),
+
+        # Concerning keywords
+        _long('keyword', 'Finding', {
+            'Finding': ['Delete capability', 'Administrator access', 'Shared credentials', 'Not enabled', 'Spreadsheet use', 'Backup issues', 'Manual workarounds'],
+            'Pct_of_Observations': [15.6, 9.9, 7.1, 6.4, 7.8, 5.7, 4.3]
+        }),
+
+        # System types (generic terms only)
+        _long('system', 'System Category', {
+            'System Category': ['Chromatography Data Systems', 'Laboratory Information Systems', 'Spreadsheet Applications', 'Analytical Instrument Software'],
+            'Observations': [24, 10, 11, 8]
+        }),
+    ], ignore_index=True).astype({'kind': 'category', 'label': 'category', 'metric': 'category'})
+
+
+dashboard_data = _dashboard_data()
+
+
+def _view(kind: str, label: str, dtypes: dict[str, str] | None = None) -> pd.DataFrame:
+    rows = dashboard_data.loc[dashboard_data['kind'] == kind]
+    wide = (
+        rows.pivot(index='label', columns='metric', values='value')
+        # pivot orders by the (alphabetical) categories; keep the source order
+        .reindex(index=rows['label'].unique(), columns=rows['metric'].unique())
+        .rename_axis(columns=None)
+        .reset_index()
+        .rename(columns={'label': label})
+        .astype(dtypes or {})
+    )
+    wide[label] = wide[label].cat.remove_unused_categories()
+    return wide
+
+
+yearly_data = _view('yearly', 'Year', {'Observations': 'int16'})
+# The surge period is derived from the year rather than stored as a metric
+yearly_data['Period'] = pd.Categorical(
+    np.where(yearly_data['Year'].astype(int) >= SURGE_YEAR, 'Surge', 'Pre-surge')
+)
+violation_data = _view('violation', 'Violation Type', {'Count': 'int16'})
+geo_data = _view('geo', 'Region', {'Observations': 'int16'})
+sophistication_data = _view('sophistication', 'Region')
+facility_data = _view('facility', 'Facility Type', {'Audit Trail Violations': 'int16', 'Other CSV Violations': 'int16'})
+growth_data = _view('growth', 'Violation Type', {'Y2022': 'int16', 'Y2024': 'int16', 'Growth_Pct': 'int16'})
+cooccurrence_data = _view('cooccurrence', 'Violation Pair', {'Co_occurrences': 'int16'})
+keyword_data = _view('keyword', 'Finding')
+system_data = _view('system', 'System Category', {'Observations': 'int16'})